@@ -0,0 +1,4 @@
+from .value import OperationEnum
+from .value import Value as Node
+
+__all__ = ["Node", "OperationEnum"]
@@ -1,24 +1,61 @@
 import math
-from enum import Enum
+from enum import IntEnum
 from typing import Callable, List, Optional, Set, Tuple, TypeAlias, Union
 
 
-class OperationEnum(str, Enum):
+class OperationEnum(IntEnum):
     """
     Enum representing possible operations that can be performed on Nodes.
+
+    Members are small integers so that dispatching on them is cheap; the symbol
+    used when displaying an operation is available as `symbol`.
+    """
+
+    symbol: str
+
+    def __new__(cls, value: int, symbol: str) -> "OperationEnum":
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.symbol = symbol
+        return member
+
+    ADD = 0, "+"
+    SUBTRACT = 1, "-"
+    MULTIPLY = 2, "*"
+    DIVIDE = 3, "/"
+    POWER = 4, "^"
+    SIGMOID = 5, "sigmoid"
+    ReLU = 6, "relu"
+    LINEAR = 7, "linear"
+    LINEAR_SIGMOID = 8, "linear sigmoid"
+    LINEAR_ReLU = 9, "linear relu"
+    NEGATE = 10, "neg"
+
+
+ParentValues: TypeAlias = Union[
+    Tuple[()],
+    Tuple["Value"],
+    Tuple["Value", "Value"],
+    Tuple["Value", "Value", "Value"],
+]
+
+
+def _as_value(other: Union["Value", int, float]) -> "Value":
     """
+    Wraps a scalar literal in a new leaf node
 
-    ADD = "+"
-    SUBTRACT = "-"
-    MULTIPLY = "*"
-    DIVIDE = "/"
-    POWER = "^"
-    SIGMOID = "sigmoid"
-    ReLU = "relu"
+    Args
+        other `Union[Value, int, float]`: The operand to wrap
 
+    Returns
+        `Value`: `other` itself if it already is a node, otherwise a new constant leaf
+    """
+    if isinstance(other, Value):
+        return other
 
-ParentValues: TypeAlias = Union[Tuple["Value"], Tuple["Value", "Value"]]
-OperationType: TypeAlias = Union[OperationEnum, Tuple[OperationEnum, str]]
+    constant = Value(other)
+    constant._constant = True
+    return constant
 
 
 class Value:
@@ -28,18 +65,30 @@ class Value:
     Attributes
         data `float`: The scalar value this node holds.
         grad `float`: The gradient of this node, used during backpropagation
-        _previous `Set[Node]`: The parent nodes that this node originates from
-        _operation `Optional[OperationType]`: The operation that produced this node
+        _previous `ParentValues`: The parent nodes that this node originates from
+        _operation `Optional[OperationEnum]`: The operation that produced this node
         _label `Optional[str]`: An optional label for the node
-        _backward `Callable[[], None]`: A function that defines how the gradient should be propagated
+        _aux `Optional[Union[int, float]]`: Non-node operand of the operation (the exponent for POWER)
+        _constant `bool`: Whether this node wraps a scalar literal rather than a user value
     """
 
+    __slots__ = (
+        "data",
+        "grad",
+        "_previous",
+        "_operation",
+        "_label",
+        "_aux",
+        "_constant",
+    )
+
     def __init__(
         self,
         data: Union[int, float],
         previous: Optional[ParentValues] = None,
-        operation: Optional[OperationType] = None,
+        operation: Optional[OperationEnum] = None,
         label: Optional[str] = None,
+        aux: Optional[Union[int, float]] = None,
     ) -> None:
         """
         Initializes a new node in the computational graph
@@ -47,38 +96,153 @@ class Value:
         Args
             data `Union[int, float]`: The value held by the node
             previous `Optional[ParentNodes]`: Parent nodes this node depends on
-            operation `Optional[OperationType]`: Operation used to compute this node
+            operation `Optional[OperationEnum]`: Operation used to compute this node
             label `Optional[str]`: Optional label for the node
+            aux `Optional[Union[int, float]]`: Non-node operand of the operation, if any
         """
         self.data = float(data)
         self.grad = 0.0
 
-        self._previous: Set[Value] = set(previous) if previous is not None else set()
+        self._previous: ParentValues = previous if previous is not None else ()
         self._operation = operation
         self._label = label
+        self._aux = aux
+        self._constant = False
 
-        self._backward: Callable[[], None] = lambda: None
-
-    def backward(self) -> None:
+    def _build_topo(self) -> List["Value"]:
         """
-        Performs backpropagation through the computational graph to compute gradients
-        for all nodes that affect the current node.
+        Flattens the computational graph ending at this node into a tape
+
+        Returns
+            `List[Value]`: Every node this node depends on, in topological order
+            (each node appears after all of its parents, this node last)
         """
         topo: List[Value] = []
         visited: Set[Value] = set()
 
-        def build_topo(v: Value) -> None:
-            if v not in visited:
-                visited.add(v)
-                for child in v._previous:
-                    build_topo(child)
+        # iterative post-order DFS; a node is appended once all its parents are
+        stack: List[Tuple[Value, bool]] = [(self, False)]
+        while stack:
+            v, expanded = stack.pop()
+            if expanded:
                 topo.append(v)
+                continue
+            if v in visited:
+                continue
+            visited.add(v)
+            stack.append((v, True))
+            stack.extend((child, False) for child in v._previous)
+
+        return topo
 
-        build_topo(self)
+    def backward(self) -> None:
+        """
+        Performs backpropagation through the computational graph to compute gradients
+        for all nodes that affect the current node.
+        """
+        topo = self._build_topo()
 
         self.grad = 1.0
         for v in reversed(topo):
-            v._backward()
+            v._run_backward()
+
+    def compile(self) -> "CompiledBackward":
+        """
+        Freezes the graph ending at this node so that its forward and backward passes
+        can be replayed without re-tracing the graph
+
+        Returns
+            `CompiledBackward`: The frozen graph rooted at this node
+        """
+        topo = self._build_topo()
+        return CompiledBackward(
+            topo,
+            [v._run_forward for v in topo if v._operation is not None],
+            [v._run_backward for v in reversed(topo) if v._operation is not None],
+            [v for v in topo if v._operation is None and not v._constant],
+        )
+
+    def _run_forward(self) -> None:
+        """
+        Recomputes the data of this node from its parents according to the
+        operation that produced it
+        """
+        op = self._operation
+
+        if op is OperationEnum.ADD:
+            a, b = self._previous
+            self.data = a.data + b.data
+        elif op is OperationEnum.MULTIPLY:
+            a, b = self._previous
+            self.data = a.data * b.data
+        elif op is OperationEnum.POWER:
+            (a,) = self._previous
+            self.data = float(a.data**self._aux)
+        elif op is OperationEnum.SIGMOID:
+            (a,) = self._previous
+            self.data = 1 / (1 + math.exp(-a.data))
+        elif op is OperationEnum.ReLU:
+            (a,) = self._previous
+            self.data = 0.0 if a.data <= 0 else a.data
+        elif op is OperationEnum.LINEAR:
+            x, w, b = self._previous
+            self.data = x.data * w.data + b.data
+        elif op is OperationEnum.LINEAR_SIGMOID:
+            x, w, b = self._previous
+            self.data = 1 / (1 + math.exp(-(x.data * w.data + b.data)))
+        elif op is OperationEnum.LINEAR_ReLU:
+            x, w, b = self._previous
+            z = x.data * w.data + b.data
+            self.data = 0.0 if z <= 0 else z
+        elif op is OperationEnum.NEGATE:
+            (a,) = self._previous
+            self.data = -a.data
+
+    def _run_backward(self) -> None:
+        """
+        Propagates the gradient of this node to its parents according to the
+        operation that produced it
+        """
+        op = self._operation
+        g = self.grad
+
+        if op is OperationEnum.ADD:
+            a, b = self._previous
+            a.grad += g
+            b.grad += g
+        elif op is OperationEnum.MULTIPLY:
+            a, b = self._previous
+            a.grad += b.data * g
+            b.grad += a.data * g
+        elif op is OperationEnum.POWER:
+            (a,) = self._previous
+            a.grad += (self._aux * a.data ** (self._aux - 1)) * g
+        elif op is OperationEnum.SIGMOID:
+            (a,) = self._previous
+            a.grad += self.data * (1 - self.data) * g
+        elif op is OperationEnum.ReLU:
+            (a,) = self._previous
+            a.grad += (self.data > 0) * g
+        elif op is OperationEnum.LINEAR:
+            x, w, b = self._previous
+            x.grad += w.data * g
+            w.grad += x.data * g
+            b.grad += g
+        elif op is OperationEnum.LINEAR_SIGMOID:
+            x, w, b = self._previous
+            g = self.data * (1 - self.data) * g
+            x.grad += w.data * g
+            w.grad += x.data * g
+            b.grad += g
+        elif op is OperationEnum.LINEAR_ReLU:
+            x, w, b = self._previous
+            g = (self.data > 0) * g
+            x.grad += w.data * g
+            w.grad += x.data * g
+            b.grad += g
+        elif op is OperationEnum.NEGATE:
+            (a,) = self._previous
+            a.grad -= g
 
     def sigmoid(self) -> "Value":
         """
@@ -89,11 +253,6 @@ class Value:
         """
         out = Value(1 / (1 + math.exp(-self.data)), (self,), OperationEnum.SIGMOID)
 
-        def _backward() -> None:
-            self.grad = out.data * (1 - out.data) * out.grad
-
-        out._backward = _backward
-
         return out
 
     def relu(self) -> "Value":
@@ -105,10 +264,64 @@ class Value:
         """
         out = Value(0 if self.data <= 0 else self.data, (self,), OperationEnum.ReLU)
 
-        def _backward() -> None:
-            self.grad += (out.data > 0) * out.grad
+        return out
 
-        out._backward = _backward
+    def linear(
+        self, w: Union["Value", int, float], b: Union["Value", int, float]
+    ) -> "Value":
+        """
+        Computes `self * w + b` as a single node
+
+        Args
+            w `Union[Value, int, float]`: The weight
+            b `Union[Value, int, float]`: The bias
+
+        Returns
+            `Node`: A new node representing the affine transform of this node
+        """
+        w = _as_value(w)
+        b = _as_value(b)
+        out = Value(self.data * w.data + b.data, (self, w, b), OperationEnum.LINEAR)
+
+        return out
+
+    def linear_sigmoid(
+        self, w: Union["Value", int, float], b: Union["Value", int, float]
+    ) -> "Value":
+        """
+        Computes `(self * w + b).sigmoid()` as a single node
+
+        Args
+            w `Union[Value, int, float]`: The weight
+            b `Union[Value, int, float]`: The bias
+
+        Returns
+            `Node`: A new node representing the sigmoid of the affine transform
+        """
+        w = _as_value(w)
+        b = _as_value(b)
+        z = self.data * w.data + b.data
+        out = Value(1 / (1 + math.exp(-z)), (self, w, b), OperationEnum.LINEAR_SIGMOID)
+
+        return out
+
+    def linear_relu(
+        self, w: Union["Value", int, float], b: Union["Value", int, float]
+    ) -> "Value":
+        """
+        Computes `(self * w + b).relu()` as a single node
+
+        Args
+            w `Union[Value, int, float]`: The weight
+            b `Union[Value, int, float]`: The bias
+
+        Returns
+            `Node`: A new node representing the ReLU of the affine transform
+        """
+        w = _as_value(w)
+        b = _as_value(b)
+        z = self.data * w.data + b.data
+        out = Value(0 if z <= 0 else z, (self, w, b), OperationEnum.LINEAR_ReLU)
 
         return out
 
@@ -119,15 +332,9 @@ class Value:
         Returns
             `Node`: Resulting node after addition
         """
-        other = other if isinstance(other, Value) else Value(other)
+        other = _as_value(other)
         out = Value(self.data + other.data, (self, other), OperationEnum.ADD)
 
-        def _backward() -> None:
-            self.grad += out.grad
-            other.grad += out.grad
-
-        out._backward = _backward
-
         return out
 
     def __mul__(self, other: Union["Value", int, float]) -> "Value":
@@ -137,15 +344,9 @@ class Value:
         Returns
             `Node`: Resulting node after addition
         """
-        other = other if isinstance(other, Value) else Value(other)
+        other = _as_value(other)
         out = Value(self.data * other.data, (self, other), OperationEnum.MULTIPLY)
 
-        def _backward() -> None:
-            self.grad += other.data * out.grad
-            other.grad += self.data * out.grad
-
-        out._backward = _backward
-
         return out
 
     def __pow__(self, other: Union[int, float]) -> "Value":
@@ -158,20 +359,13 @@ class Value:
         Returns
             `Node`: Resulting node after exponentiation.
         """
-        out = Value(self.data**other, (self,), (OperationEnum.POWER, f"{other}"))
-
-        def _backward():
-            self.grad += (other * self.data ** (other - 1)) * out.grad
-
-        out._backward = _backward
-
-        return out
+        return Value(self.data**other, (self,), OperationEnum.POWER, aux=other)
 
     def __neg__(self) -> "Value":
         """
         -self
         """
-        return self * -1
+        return Value(-self.data, (self,), OperationEnum.NEGATE)
 
     def __radd__(self, other: Union["Value", int, float]) -> "Value":
         """
@@ -217,3 +411,73 @@ class Value:
             `str`: The string representation.
         """
         return f"Value(data={self.data}, grad={self.grad})"
+
+
+class CompiledBackward:
+    """
+    A graph frozen into a flat tape by `Value.compile`.
+
+    The graph is traced once; every `run` afterwards recomputes the data of each
+    node from the current leaf values, resets the gradients and calls the pre-bound
+    backward methods in order. Updating `data` on the leaves between runs (e.g. an
+    optimizer step) is therefore reflected in the next run.
+
+    Attributes
+        root `Value`: The node gradients are computed with respect to
+        nodes `List[Value]`: Every node in the graph, in topological order
+        leaves `List[Value]`: The user-created nodes the graph depends on, excluding
+            constants wrapped from scalar literals
+    """
+
+    __slots__ = ("root", "nodes", "leaves", "_forwards", "_backwards")
+
+    def __init__(
+        self,
+        nodes: List[Value],
+        forwards: List[Callable[[], None]],
+        backwards: List[Callable[[], None]],
+        leaves: List[Value],
+    ) -> None:
+        """
+        Initializes a compiled graph
+
+        Args
+            nodes `List[Value]`: Every node in the graph, in topological order
+            forwards `List[Callable[[], None]]`: The forward methods of the non-leaf nodes in
+                topological order
+            backwards `List[Callable[[], None]]`: The backward methods of the non-leaf nodes in
+                reverse topological order
+            leaves `List[Value]`: The user-created nodes the graph depends on
+        """
+        self.root = nodes[-1]
+        self.nodes = nodes
+        self.leaves = leaves
+        self._forwards = forwards
+        self._backwards = backwards
+
+    def forward(self) -> None:
+        """
+        Recomputes the data of every node in the graph from the current leaf values.
+        """
+        for forward in self._forwards:
+            forward()
+
+    def zero_grad(self) -> None:
+        """
+        Resets the gradient of every node in the graph to zero in a single pass
+        over the tape.
+        """
+        for v in self.nodes:
+            v.grad = 0.0
+
+    def run(self) -> None:
+        """
+        Recomputes the graph from the current leaf values, resets every gradient and
+        backpropagates from the root again.
+        """
+        self.forward()
+        self.zero_grad()
+
+        self.root.grad = 1.0
+        for backward in self._backwards:
+            backward()
@@ -1,8 +1,10 @@
-from graphviz import Digraph
-from typing import Set, Tuple
+from typing import TYPE_CHECKING, Dict, List, Set
 
 from engine.value import Value
 
+if TYPE_CHECKING:
+    from graphviz import Digraph
+
 
 class Visualize:
     """
@@ -13,7 +15,7 @@ class Visualize:
     """
 
     @staticmethod
-    def _trace(root: Value) -> Tuple[Set[Value], Set[Tuple[Value, Value]]]:
+    def _trace(root: Value) -> List[Value]:
         """
         Traces the computational graph starting from the root node
 
@@ -21,24 +23,22 @@ class Visualize:
             root `Node`: The root node from which to begin the trace
 
         Returns
-            `Tuple[Set[Node], Set[Tuple[Node, Node]]]`:
-                A tuple containing:
-                    - a set of all nodes in the graph
-                    - a set of edges representing dependencies between nodes
+            `List[Node]`: Every node in the graph, each appearing exactly once
         """
 
-        nodes: Set[Value] = set()
-        edges: Set[Tuple[Value, Value]] = set()
+        nodes: List[Value] = []
+        seen: Set[int] = set()
 
-        def build(v: Value) -> None:
-            if v not in nodes:
-                nodes.add(v)
-                for child in v._previous:
-                    edges.add((child, v))
-                    build(child)
+        stack: List[Value] = [root]
+        while stack:
+            v = stack.pop()
+            if id(v) in seen:
+                continue
+            seen.add(id(v))
+            nodes.append(v)
+            stack.extend(v._previous)
 
-        build(root)
-        return nodes, edges
+        return nodes
 
     @staticmethod
     def _format_node_label(node: Value) -> str:
@@ -63,7 +63,9 @@ class Visualize:
         return f"{{ {' | '.join(parts)} }}"
 
     @staticmethod
-    def draw(root: Value, format: str = "svg", rankdir: str = "LR") -> Digraph:
+    def draw(
+        root: Value, format: str = "svg", rankdir: str = "LR", max_nodes: int = 1000
+    ) -> "Digraph":
         """
         Draws the computational graph rooted at the specified node
 
@@ -71,35 +73,45 @@ class Visualize:
             root `Node`: The root node of the computational graph
             format `str`: Output format for the graph (default is "svg")
             rankdir `str`: Layout direction; either "LR" (left-to-right) or "TB" (top-to-bottom)
+            max_nodes `int`: Largest graph that will be drawn (default is 1000)
 
         Returns:
             `Digraph`: A Graphviz Digraph object representing the graph.
+
+        Raises:
+            `ValueError`: If the graph has more than `max_nodes` nodes
         """
 
         assert rankdir in {"LR", "TB"}, "rankdir must be 'LR' or 'TB'"
 
-        nodes, edges = Visualize._trace(root)
+        nodes = Visualize._trace(root)
+        if len(nodes) > max_nodes:
+            raise ValueError(
+                f"graph too large to render ({len(nodes)} nodes, max_nodes={max_nodes})"
+            )
+
+        # imported lazily so that importing this module does not pay for graphviz
+        from graphviz import Digraph
+
         dot = Digraph(format=format, graph_attr={"rankdir": rankdir})
 
+        node_ids: Dict[int, str] = {id(n): str(id(n)) for n in nodes}
+
         for n in nodes:
-            node_id = str(id(n))
+            node_id = node_ids[id(n)]
             label = Visualize._format_node_label(n)
             dot.node(name=node_id, label=label, shape="record")
 
             if n._operation is not None:
-                if isinstance(n._operation, tuple):
-                    op, suffix = n._operation
-                    op_label = f"{op.value}{suffix}" if suffix else op.value
-                else:
-                    op_label = n._operation.value
+                op_label = n._operation.symbol
+                if n._aux is not None:
+                    op_label = f"{op_label}{n._aux}"
 
-                op_node_name = f"op_{id(n)}"
+                op_node_name = f"op_{node_id}"
                 dot.node(name=op_node_name, label=op_label)
                 dot.edge(op_node_name, node_id)
 
-        for parent, child in edges:
-            if child._operation is not None:
-                op_node_name = f"op_{id(child)}"
-                dot.edge(str(id(parent)), op_node_name)
+                for parent in n._previous:
+                    dot.edge(node_ids[id(parent)], op_node_name)
 
         return dot
@@ -0,0 +1,116 @@
+import math
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from engine.value import Value  # noqa: E402
+
+
+def _close(a: float, b: float) -> bool:
+    return math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)
+
+
+def test_duplicate_parent() -> None:
+    x = Value(1.5)
+    (x + x).backward()
+    assert _close(x.grad, 2.0)
+
+    y = Value(1.5)
+    (y * y).backward()
+    assert _close(y.grad, 3.0)
+
+
+def test_fused_ops_match_unfused() -> None:
+    cases = [
+        (lambda x, w, b: x.linear(w, b), lambda x, w, b: x * w + b),
+        (lambda x, w, b: x.linear_sigmoid(w, b), lambda x, w, b: (x * w + b).sigmoid()),
+        (lambda x, w, b: x.linear_relu(w, b), lambda x, w, b: (x * w + b).relu()),
+    ]
+
+    # the bias values exercise both sides of the ReLU
+    for fused, unfused in cases:
+        for data in ([0.5, 3.14, -2.0], [0.5, 3.14, 1.0]):
+            fused_values = [Value(d) for d in data]
+            unfused_values = [Value(d) for d in data]
+
+            y_fused = fused(*fused_values)
+            y_unfused = unfused(*unfused_values)
+            y_fused.backward()
+            y_unfused.backward()
+
+            assert _close(y_fused.data, y_unfused.data)
+            for a, b in zip(fused_values, unfused_values):
+                assert _close(a.grad, b.grad)
+
+
+def test_negate() -> None:
+    x = Value(1.5)
+    y = -x
+    y.backward()
+    assert _close(y.data, -1.5)
+    assert _close(x.grad, -1.0)
+
+    x, y = Value(1.5), Value(-0.5)
+    z = x - y
+    z.backward()
+    assert _close(z.data, 2.0)
+    assert _close(x.grad, 1.0)
+    assert _close(y.grad, -1.0)
+
+    x = Value(1.5)
+    z = 4 - x
+    z.backward()
+    assert _close(z.data, 2.5)
+    assert _close(x.grad, -1.0)
+
+
+def test_sigmoid_accumulates_with_other_consumers() -> None:
+    s = 1 / (1 + math.exp(-0.3))
+    expected = s * (1 - s) + 3
+
+    for build in (lambda x: x * 3 + x.sigmoid(), lambda x: x.sigmoid() + x * 3):
+        x = Value(0.3)
+        build(x).backward()
+        assert _close(x.grad, expected)
+
+
+def _every_op_graph(x: Value, w: Value, b: Value) -> Value:
+    a = x * w + b**2
+    c = -a + x.sigmoid()
+    d = (a - 1).relu() / w
+    return c * d + x.linear(w, 2) + x.linear_sigmoid(w, b) * x.linear_relu(w, 3)
+
+
+def test_compiled_run_matches_fresh_backward() -> None:
+    x, w, b = Value(0.5), Value(1.5), Value(-1.0)
+    root = _every_op_graph(x, w, b)
+    compiled = root.compile()
+
+    assert any(v._constant for v in compiled.nodes)
+    assert {id(v) for v in compiled.leaves} == {id(x), id(w), id(b)}
+
+    for data in ([1.2, 0.8, 0.7], [-0.4, 2.5, 1.3]):
+        x.data, w.data, b.data = data
+        compiled.run()
+
+        fresh = [Value(d) for d in data]
+        expected = _every_op_graph(*fresh)
+        expected.backward()
+
+        assert _close(root.data, expected.data)
+        for leaf, reference in zip((x, w, b), fresh):
+            assert _close(leaf.grad, reference.grad)
+
+        # gradients are reset between runs rather than accumulated
+        grads = [x.grad, w.grad, b.grad]
+        compiled.run()
+        assert _close(root.data, expected.data)
+        assert [x.grad, w.grad, b.grad] == grads
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,91 @@
+import os
+import sys
+import types
+from typing import Dict, List, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from engine.value import Value  # noqa: E402
+from visualize import Visualize  # noqa: E402
+
+
+class _Digraph:
+    """
+    Records the calls `Visualize.draw` makes instead of rendering them
+    """
+
+    def __init__(self, **kwargs: object) -> None:
+        self.nodes: Dict[str, str] = {}
+        self.edges: List[Tuple[str, str]] = []
+
+    def node(self, name: str, label: str, **kwargs: object) -> None:
+        self.nodes[name] = label
+
+    def edge(self, tail: str, head: str) -> None:
+        self.edges.append((tail, head))
+
+
+def _draw(root: Value, **kwargs: object) -> _Digraph:
+    stub = types.ModuleType("graphviz")
+    stub.Digraph = _Digraph  # type: ignore[attr-defined]
+
+    previous = sys.modules.get("graphviz")
+    sys.modules["graphviz"] = stub
+    try:
+        return Visualize.draw(root, **kwargs)  # type: ignore[return-value]
+    finally:
+        if previous is None:
+            del sys.modules["graphviz"]
+        else:
+            sys.modules["graphviz"] = previous
+
+
+def test_trace_visits_each_node_once() -> None:
+    x = Value(2.0, label="x")
+    xx = x * x
+    y = xx**2
+
+    nodes = Visualize._trace(y)
+    assert len(nodes) == 3
+    assert {id(n) for n in nodes} == {id(x), id(xx), id(y)}
+
+
+def test_draw_nodes_edges_and_labels() -> None:
+    x = Value(2.0, label="x")
+    xx = x * x
+    y = xx**2
+
+    dot = _draw(y)
+
+    # three value records plus one operation node each for `*` and `^2`
+    assert len(dot.nodes) == 5
+    assert dot.nodes[f"op_{id(y)}"] == "^2"
+    assert dot.nodes[f"op_{id(xx)}"] == "*"
+
+    # x feeds the multiplication twice, so it gets two edges into the op node
+    assert len(dot.edges) == 5
+    assert dot.edges.count((str(id(x)), f"op_{id(xx)}")) == 2
+    assert (str(id(xx)), f"op_{id(y)}") in dot.edges
+    assert (f"op_{id(y)}", str(id(y))) in dot.edges
+    assert (f"op_{id(xx)}", str(id(xx))) in dot.edges
+
+
+def test_draw_rejects_large_graphs() -> None:
+    x = Value(1.0)
+    y = x
+    for _ in range(10):
+        y = y + x
+
+    try:
+        _draw(y, max_nodes=5)
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError for a graph over max_nodes")
+
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")